@@ -6,7 +6,7 @@ import os
 import random
 import math
 from multiprocessing import Pool, cpu_count
-from wordle import WordleSolver
+from wordle import Absurdle, WordleSolver
 
 WIDTH, HEIGHT = 800, 500
 CELL_SIZE = 52
@@ -26,16 +26,21 @@ BLACK = (0, 0, 0)
 class Game:
     def __init__(self, wordle):
         self._game = wordle
+        self._is_adversarial = isinstance(wordle, Absurdle)
+        self._word_length = wordle.word_length
+        self._width = WIDTH + 2 * (self._word_length - 5) * (CELL_SIZE + PADDING)
+        self._end_screen_grid_left = self._width - 95 - self._word_length * (CELL_SIZE + PADDING)
+        self._end_screen_text_center = self._end_screen_grid_left // 2 + 10
         self._is_game_started = False
         self._guess_letters = []
         self._word_suggestions = []
         self._best_valid_suggestion = None
         self._suggestions_progress = 0.0
-        self._grid_rects = [[None for _ in range(5)] for _ in range(6)]
-        self._grid_rect_colors = [[None for _ in range(5)] for _ in range(6)]
+        self._grid_rects = [[None for _ in range(self._word_length)] for _ in range(6)]
+        self._grid_rect_colors = [[None for _ in range(self._word_length)] for _ in range(6)]
 
         for row in range(6):
-            for col in range(5):
+            for col in range(self._word_length):
                 x = col * (CELL_SIZE + PADDING) + 100
                 y = row * (CELL_SIZE + PADDING) + 80
                 rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
@@ -66,7 +71,7 @@ class Game:
 
         pygame.init()
         pygame.display.set_caption("Wordle Solver")
-        self._screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self._screen = pygame.display.set_mode((self._width, HEIGHT))
         self._clock = pygame.time.Clock()
 
         wordle_font_path = os.path.join("assets", "fonts", "franklin_gothic_bold.ttf")
@@ -112,13 +117,14 @@ class Game:
             return
         
         if event.type == pygame.KEYDOWN:
-            if event.unicode.isalpha():
-                self._type_letter(event.unicode.upper())
+            letter = self._get_alphabet_letter(event.unicode)
+            if letter is not None:
+                self._type_letter(letter)
             elif event.key == pygame.K_BACKSPACE:
                 if self._guess_letters:
                     self._delete_letter()
             elif event.key == pygame.K_RETURN:
-                if len(self._guess_letters) == 5:
+                if len(self._guess_letters) == self._word_length:
                     guess = "".join(self._guess_letters)
                     if not self._game.is_valid_guess(guess):
                         self._trigger_not_in_word_list_banner()
@@ -127,11 +133,20 @@ class Game:
                 else:
                     self._trigger_not_enough_letters_banner()
     
+    def _get_alphabet_letter(self, char):
+        if len(char) != 1:
+            return None
+        if char in self._game.alphabet:
+            return char
+        if char.upper() in self._game.alphabet:
+            return char.upper()
+        return None
+
     def _type_letter(self, letter):
         with self._game_state_lock:
             guesses_made = self._game.guesses_made
 
-        if len(self._guess_letters) == 5:
+        if len(self._guess_letters) == self._word_length:
             return
         
         self._guess_letters.append(letter)
@@ -186,7 +201,7 @@ class Game:
             guesses_made = self._game.guesses_made
 
         row = guesses_made - 1
-        for col in range(5):
+        for col in range(self._word_length):
             if color_grid[row][col] == "g":
                 self._grid_rect_colors[row][col] = GREEN
             elif color_grid[row][col] == "y":
@@ -220,6 +235,13 @@ class Game:
 
             possible_answers = WordleSolver._get_possible_answers(word_list, grid, color_grid)
 
+            if self._is_adversarial:
+                get_k_guesses = WordleSolver.get_k_minimax_guesses
+                non_narrowing_score = len(possible_answers)
+            else:
+                get_k_guesses = WordleSolver.get_k_optimal_guesses
+                non_narrowing_score = 0
+
             word_index = 0
             chunk_size_constant = 8
             chunk_size = chunk_size_constant * math.ceil(len(word_list) / len(possible_answers))
@@ -230,14 +252,15 @@ class Game:
                 if not is_still_same:
                     break
 
-                chunk_results, chunk_best_valid_suggestion = WordleSolver.get_k_optimal_guesses(
+                chunk_results, chunk_best_valid_suggestion = get_k_guesses(
                     word_list=word_list,
                     grid=grid,
                     color_grid=color_grid,
                     word_index=word_index,
                     chunk_size=chunk_size,
                     pool=self._suggestions_executor_pool,
-                    k=WORD_SUGGESTIONS_SIZE
+                    k=WORD_SUGGESTIONS_SIZE,
+                    alphabet=self._game.alphabet
                 )
 
                 with self._game_state_lock:
@@ -250,25 +273,33 @@ class Game:
                     self._suggestions_progress = min(1.0, (word_index + chunk_size) / len(word_list))
                 
                 if not self._is_game_ended.is_set() and is_still_same:
-                    self._merge_word_suggestions(chunk_results, chunk_best_valid_suggestion)
+                    self._merge_word_suggestions(chunk_results, chunk_best_valid_suggestion, non_narrowing_score)
 
                 word_index += chunk_size
 
         self._suggestions_task_queue.put(worker)
 
-    def _merge_word_suggestions(self, new_suggestions, new_best_valid_suggestion):
+    def _merge_word_suggestions(self, new_suggestions, new_best_valid_suggestion, non_narrowing_score):
         with self._word_suggestions_lock:
             new_word_suggestions = self._word_suggestions + new_suggestions
-            new_word_suggestions.sort(key=lambda x: (x[1], x[2]), reverse=True)
+            if self._is_adversarial:
+                new_word_suggestions.sort(key=lambda x: (x[1], not x[2]))
+            else:
+                new_word_suggestions.sort(key=lambda x: (x[1], x[2]), reverse=True)
 
-            if self._best_valid_suggestion is None or (new_best_valid_suggestion is not None and new_best_valid_suggestion[1] > self._best_valid_suggestion[1]):
+            if self._best_valid_suggestion is None or (new_best_valid_suggestion is not None and self._is_better_score(new_best_valid_suggestion[1], self._best_valid_suggestion[1])):
                 self._best_valid_suggestion = new_best_valid_suggestion
 
-            is_not_narrowing_and_invalid = new_word_suggestions[-1][1] == 0 and not new_word_suggestions[-1][2]
+            is_not_narrowing_and_invalid = new_word_suggestions[-1][1] == non_narrowing_score and not new_word_suggestions[-1][2]
             while len(new_word_suggestions) > 0 and (len(new_word_suggestions) > WORD_SUGGESTIONS_SIZE or is_not_narrowing_and_invalid):
                 new_word_suggestions.pop()
 
             self._word_suggestions = new_word_suggestions
+
+    def _is_better_score(self, score, other_score):
+        if self._is_adversarial:
+            return score < other_score
+        return score > other_score
     
     def _clean_up_resources(self):
         self._is_game_ended.set()
@@ -306,7 +337,7 @@ class Game:
             return
         
         banner_surface = self._text_font.render(self._banner_message, True, RED)
-        banner_rect = banner_surface.get_rect(center=(WIDTH // 2, HEIGHT - 40))
+        banner_rect = banner_surface.get_rect(center=(self._width // 2, HEIGHT - 40))
         self._screen.blit(banner_surface, banner_rect)
 
         if pygame.time.get_ticks() >= self._banner_end:
@@ -315,7 +346,7 @@ class Game:
     
     def _draw_word_suggestions(self):
         title_surface = self._text_font.render("Word Suggestions", True, WHITE)
-        title_rect = title_surface.get_rect(topright=(WIDTH - 65, 70))
+        title_rect = title_surface.get_rect(topright=(self._width - 65, 70))
         self._screen.blit(title_surface, title_rect)
         
         with self._word_suggestions_lock:
@@ -329,22 +360,23 @@ class Game:
         
         if len(word_suggestions) == 0:
             loading_text_surface = self._text_font.render("Loading...", True, WHITE)
-            loading_text_rect = loading_text_surface.get_rect(topright=(WIDTH - 130, 215))
+            loading_text_rect = loading_text_surface.get_rect(topright=(self._width - 130, 215))
             self._screen.blit(loading_text_surface, loading_text_rect)
             return
         
-        for i, (word, entropy, is_valid_word) in enumerate(word_suggestions):
+        for i, (word, score, is_valid_word) in enumerate(word_suggestions):
             text_color = BLUE if is_valid_word else WHITE
             word_suggestion_surface = self._text_font.render(word, True, text_color)
-            word_suggestion_rect = word_suggestion_surface.get_rect(topleft=(WIDTH - 355, 125 + i * 40))
-            entropy_suggestion_surface = self._text_font.render(f"({entropy:.2f})", True, text_color)
-            entropy_suggestion_rect = entropy_suggestion_surface.get_rect(topright=(WIDTH - 65, 125 + i * 40))
+            word_suggestion_rect = word_suggestion_surface.get_rect(topleft=(self._width - 355, 125 + i * 40))
+            score_text = f"({score})" if self._is_adversarial else f"({score:.2f})"
+            score_suggestion_surface = self._text_font.render(score_text, True, text_color)
+            score_suggestion_rect = score_suggestion_surface.get_rect(topright=(self._width - 65, 125 + i * 40))
             self._screen.blit(word_suggestion_surface, word_suggestion_rect)
-            self._screen.blit(entropy_suggestion_surface, entropy_suggestion_rect)
+            self._screen.blit(score_suggestion_surface, score_suggestion_rect)
     
     def _draw_progress_bar(self):
         width, height = 300, 28
-        left, top = WIDTH - width - 60, HEIGHT - height - 85
+        left, top = self._width - width - 60, HEIGHT - height - 85
         border_width = 3
     
         pygame.draw.rect(self._screen, BORDER_GRAY, (left, top, width, height))
@@ -363,7 +395,7 @@ class Game:
 
     def _display_game_screen(self):
         for row in range(6):
-            for col in range(5):
+            for col in range(self._word_length):
                 self._draw_cell(row, col)
         
         self._draw_banner()
@@ -389,7 +421,7 @@ class Game:
             for text in title_texts
         ]
         title_rects = [
-            surface.get_rect(center=(220, top))
+            surface.get_rect(center=(self._end_screen_text_center, top))
             for surface, top in zip(title_surfaces, title_tops)
         ]
 
@@ -397,8 +429,8 @@ class Game:
             self._screen.blit(surface, rect)
 
         for row in range(6):
-            for col in range(5):
-                self._grid_rects[row][col].x = col * (CELL_SIZE + PADDING) + 420
+            for col in range(self._word_length):
+                self._grid_rects[row][col].x = col * (CELL_SIZE + PADDING) + self._end_screen_grid_left
                 self._grid_rects[row][col].y = row * (CELL_SIZE + PADDING) + 80
                 self._draw_cell(row, col)
 
@@ -418,17 +450,17 @@ class Game:
             for text in title_texts
         ]
         title_rects = [
-            surface.get_rect(center=(220, top))
+            surface.get_rect(center=(self._end_screen_text_center, top))
             for surface, top in zip(title_surfaces, title_tops)
         ]
 
         for surface, rect in zip(title_surfaces, title_rects):
             self._screen.blit(surface, rect)
         
-        for col in range(5):
+        for col in range(self._word_length):
             row = 5
 
-            x = 220 - ((2 - col) * (CELL_SIZE + PADDING)) - CELL_SIZE / 2
+            x = self._end_screen_text_center - (((self._word_length - 1) / 2 - col) * (CELL_SIZE + PADDING)) - CELL_SIZE / 2
             y = 280
             rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
             pygame.draw.rect(self._screen, GREEN, rect)
@@ -439,7 +471,7 @@ class Game:
             self._screen.blit(letter_surface, letter_rect)
 
         for row in range(6):
-            for col in range(5):
-                self._grid_rects[row][col].x = col * (CELL_SIZE + PADDING) + 420
+            for col in range(self._word_length):
+                self._grid_rects[row][col].x = col * (CELL_SIZE + PADDING) + self._end_screen_grid_left
                 self._grid_rects[row][col].y = row * (CELL_SIZE + PADDING) + 80
                 self._draw_cell(row, col)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import pickle
+import os
+import random
+import time
+from multiprocessing import Pool, cpu_count
+from wordle import Wordle, WordleSolver
+
+NUM_STATES = 1000
+NUM_BASELINE_STATES = 5
+NUM_ANSWERS = 3
+GUESS_SEQUENCES = [
+    ["CRANE", "SLOTH"],
+    ["SLATE", "CORNY"],
+    ["AUDIO", "STERN"],
+    ["RAISE", "CLOUT"],
+    ["TRACE", "PLUMB"],
+]
+WORD_SUGGESTIONS_SIZE = 6
+RANDOM_SEED = 0
+
+with open(os.path.join("assets", "words", "word_list.pkl"), "rb") as f:
+    word_list = pickle.load(f)
+
+def generate_states(num_states):
+    answers = random.sample(word_list, NUM_ANSWERS)
+    states = []
+    for _ in range(num_states):
+        wordle = Wordle(word_list, answer=random.choice(answers))
+        for guess in random.choice(GUESS_SEQUENCES):
+            wordle.guess_word(guess)
+            if not wordle.is_game_active:
+                break
+        states.append((wordle.grid, wordle.color_grid))
+    return states
+
+def count_distinct_histories(states):
+    return len({
+        (tuple(map(tuple, grid)), tuple(map(tuple, color_grid)))
+        for grid, color_grid in states
+    })
+
+def report_throughput(name, num_states, elapsed_time):
+    print(f"{name}: {num_states} states in {elapsed_time:.2f} seconds ({num_states / elapsed_time:.2f} states/s).")
+
+if __name__ == "__main__":
+    random.seed(RANDOM_SEED)
+    states = generate_states(NUM_STATES)
+    print(f"Generated {len(states)} states with {count_distinct_histories(states)} distinct histories.")
+
+    with Pool(processes=cpu_count()) as pool:
+        baseline_states = random.sample(states, NUM_BASELINE_STATES)
+        start_time = time.perf_counter()
+        for grid, color_grid in baseline_states:
+            WordleSolver.get_k_optimal_guesses(
+                word_list=word_list,
+                grid=grid,
+                color_grid=color_grid,
+                word_index=0,
+                chunk_size=len(word_list),
+                pool=pool,
+                k=WORD_SUGGESTIONS_SIZE
+            )
+        report_throughput("Per-state", len(baseline_states), time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        WordleSolver.get_k_optimal_guesses_batch(
+            word_list=word_list,
+            states=states,
+            pool=pool,
+            k=WORD_SUGGESTIONS_SIZE
+        )
+        report_throughput("Batch", len(states), time.perf_counter() - start_time)
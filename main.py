@@ -3,17 +3,22 @@ import os
 
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
 
-from wordle import Wordle
+from wordle import Wordle, Absurdle
 from Game import Game
 from utils import timer
 
 PREDEFINED_ANSWER = None
+ADVERSARIAL_MODE = False
+WORD_LENGTH = 5
 
 with open(os.path.join("assets", "words", "word_list.pkl"), "rb") as f:
     word_list = pickle.load(f)
 
 if __name__ == "__main__":
-    wordle = Wordle(word_list, answer=PREDEFINED_ANSWER)
+    if ADVERSARIAL_MODE:
+        wordle = Absurdle(word_list, word_length=WORD_LENGTH)
+    else:
+        wordle = Wordle(word_list, answer=PREDEFINED_ANSWER, word_length=WORD_LENGTH)
     game = Game(wordle)
 
     with timer():
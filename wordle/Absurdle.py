@@ -0,0 +1,49 @@
+import random
+from .Wordle import Wordle
+from .WordleSolver import WordleSolver
+from .constants import ALPHABET, WORD_LENGTH
+
+class Absurdle(Wordle):
+    def __init__(self, word_list, *, word_length=WORD_LENGTH, alphabet=ALPHABET):
+        super().__init__(word_list, word_length=word_length, alphabet=alphabet)
+        self._answer = None
+        self._possible_answers = word_list[:]
+
+    @property
+    def possible_answers(self):
+        return self._possible_answers
+
+    @Wordle._require_game_active
+    def guess_word(self, word):
+        if not self.is_valid_guess(word):
+            raise ValueError("Invalid guess word.")
+
+        partition = WordleSolver.get_partition(word, self._possible_answers)
+        coloring_id, self._possible_answers = max(
+            partition.items(),
+            key=lambda x: self._get_bucket_priority(x[0], x[1])
+        )
+
+        self._grid[self._guesses_made] = list(word)
+        self._color_grid[self._guesses_made] = self._get_coloring_from_id(coloring_id, self._word_length)
+        self._guesses_made += 1
+
+        if coloring_id == 3 ** self._word_length - 1:
+            self._answer = word
+            self._win = True
+            self._is_game_active = False
+        elif self._guesses_made == 6:
+            self._answer = random.choice(self._possible_answers)
+            self._is_game_active = False
+
+    def _get_bucket_priority(self, coloring_id, bucket):
+        coloring = self._get_coloring_from_id(coloring_id, self._word_length)
+        return (len(bucket), -coloring.count("g"), -coloring.count("y"), -coloring_id)
+
+    @staticmethod
+    def _get_coloring_from_id(coloring_id, word_length):
+        coloring = []
+        for _ in range(word_length):
+            coloring.append("xyg"[coloring_id % 3])
+            coloring_id //= 3
+        return coloring
@@ -1,26 +1,31 @@
+from .constants import ALPHABET
+
 class TrieNode:
-    def __init__(self):
-        self.children = [None] * 26
+    def __init__(self, alphabet_size):
+        self.children = [None] * alphabet_size
         self.is_end = False
 
 class Trie:
-    def __init__(self):
-        self.root = TrieNode()
+    def __init__(self, alphabet=ALPHABET):
+        self._alphabet_indices = {char: index for index, char in enumerate(alphabet)}
+        self.root = TrieNode(len(alphabet))
     
     def insert(self, word):
         node = self.root
         for char in word:
-            index = ord(char) - ord('A')
+            if char not in self._alphabet_indices:
+                raise ValueError("Invalid character in word.")
+            index = self._alphabet_indices[char]
             if not node.children[index]:
-                node.children[index] = TrieNode()
+                node.children[index] = TrieNode(len(self._alphabet_indices))
             node = node.children[index]
         node.is_end = True
     
     def search(self, word):
         node = self.root
         for char in word:
-            index = ord(char) - ord('A')
-            if not node.children[index]:
+            index = self._alphabet_indices.get(char)
+            if index is None or not node.children[index]:
                 return False
             node = node.children[index]
-        return node.is_end
\ No newline at end of file
+        return node.is_end
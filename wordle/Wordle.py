@@ -1,12 +1,26 @@
 import random
 from .colors import colorize
+from .constants import ALPHABET, WORD_LENGTH, MIN_WORD_LENGTH, MAX_WORD_LENGTH
 
 class Wordle:
-    def __init__(self, word_list, *, answer=None):
+    def __init__(self, word_list, *, answer=None, word_length=WORD_LENGTH, alphabet=ALPHABET):
+        if not MIN_WORD_LENGTH <= word_length <= MAX_WORD_LENGTH:
+            raise ValueError(f"Word length must be between {MIN_WORD_LENGTH} and {MAX_WORD_LENGTH}.")
+
         self._word_list = word_list
+        self._word_length = word_length
+        self._alphabet = alphabet
+        self._alphabet_indices = {char: index for index, char in enumerate(alphabet)}
+
+        words = word_list + [answer] if answer else word_list
+        if any(len(word) != word_length for word in words):
+            raise ValueError(f"Words must be {word_length} letters long.")
+        if not set("".join(words)) <= set(alphabet):
+            raise ValueError("Words must only contain letters from the alphabet.")
+
         self._answer = answer if answer else random.choice(word_list)
-        self._grid = [[" "] * 5 for _ in range(6)]
-        self._color_grid = [["x"] * 5 for _ in range(6)]
+        self._grid = [[" "] * word_length for _ in range(6)]
+        self._color_grid = [["x"] * word_length for _ in range(6)]
         self._guesses_made = 0
 
         self._win = False
@@ -24,6 +38,14 @@ class Wordle:
     def word_list(self):
         return self._word_list
 
+    @property
+    def word_length(self):
+        return self._word_length
+
+    @property
+    def alphabet(self):
+        return self._alphabet
+
     @property
     def grid(self):
         return self._grid
@@ -75,26 +97,26 @@ class Wordle:
     
     @_require_game_active
     def _get_coloring(self, word):
-        counts = [0] * 26
+        counts = [0] * len(self._alphabet)
         for char in self._answer:
-            counts[ord(char) - ord('A')] += 1
+            counts[self._alphabet_indices[char]] += 1
 
-        coloring = ["x"] * 5
+        coloring = ["x"] * self._word_length
 
-        for i in range(5):
+        for i in range(self._word_length):
             if coloring[i] != "x":
                 continue
 
             if word[i] == self._answer[i]:
                 coloring[i] = "g"
-                counts[ord(word[i]) - ord('A')] -= 1
+                counts[self._alphabet_indices[word[i]]] -= 1
 
-        for i in range(5):
+        for i in range(self._word_length):
             if coloring[i] != "x":
                 continue
 
-            if counts[ord(word[i]) - ord('A')] > 0:
+            if counts[self._alphabet_indices[word[i]]] > 0:
                 coloring[i] = "y"
-                counts[ord(word[i]) - ord('A')] -= 1
+                counts[self._alphabet_indices[word[i]]] -= 1
 
         return coloring
\ No newline at end of file
@@ -1,50 +1,172 @@
 import signal
+from array import array
+from collections import Counter
 from math import log2
 from .Trie import Trie
+from .constants import ALPHABET, MAX_WORD_LENGTH
+
+COLORING_EXPONENTS = [3 ** i for i in range(MAX_WORD_LENGTH)]
+BATCH_CHUNK_SIZE = 256
 
 class WordleSolver:
     @staticmethod
-    def get_k_optimal_guesses(word_list, grid, color_grid, word_index, chunk_size, pool, k):
+    def get_k_optimal_guesses(word_list, grid, color_grid, word_index, chunk_size, pool, k, alphabet=ALPHABET):
+        return WordleSolver._get_k_best_guesses(
+            word_list, grid, color_grid, word_index, chunk_size, pool, k, alphabet,
+            score_function=WordleSolver._get_shannon_entropy,
+            is_higher_score_better=True
+        )
+    
+    @staticmethod
+    def get_k_minimax_guesses(word_list, grid, color_grid, word_index, chunk_size, pool, k, alphabet=ALPHABET):
+        return WordleSolver._get_k_best_guesses(
+            word_list, grid, color_grid, word_index, chunk_size, pool, k, alphabet,
+            score_function=WordleSolver._get_worst_bucket_size,
+            is_higher_score_better=False
+        )
+    
+    @staticmethod
+    def get_k_optimal_guesses_batch(word_list, states, pool, k):
+        history_indices = {}
+        state_history_indices = []
+        for grid, color_grid in states:
+            history = WordleSolver._get_guessed_rows(grid, color_grid)
+            if history not in history_indices:
+                history_indices[history] = len(history_indices)
+            state_history_indices.append(history_indices[history])
+
+        possible_answer_set_indices = {}
+        history_set_indices = []
+        for history in history_indices:
+            possible_answers = tuple(WordleSolver._filter_possible_answers(word_list, history))
+            if possible_answers not in possible_answer_set_indices:
+                possible_answer_set_indices[possible_answers] = len(possible_answer_set_indices)
+            history_set_indices.append(possible_answer_set_indices[possible_answers])
+
+        possible_answer_sets = list(possible_answer_set_indices)
+        candidate_groups = []
+        group_set_indices = []
+        for set_indices in WordleSolver._group_overlapping_sets(possible_answer_sets):
+            candidates = sorted(set().union(*(possible_answer_sets[set_index] for set_index in set_indices)))
+            candidate_indices = {answer: index for index, answer in enumerate(candidates)}
+            possible_answer_indices = [
+                [candidate_indices[answer] for answer in possible_answer_sets[set_index]]
+                for set_index in set_indices
+            ]
+            candidate_groups.append((candidates, possible_answer_indices))
+            group_set_indices += set_indices
+
+        chunk_results = pool.starmap(
+            WordleSolver._get_k_optimal_guesses_for_sets,
+            [
+                (word_list[word_index:word_index+BATCH_CHUNK_SIZE], candidate_groups, k)
+                for word_index in range(0, len(word_list), BATCH_CHUNK_SIZE)
+            ]
+        )
+
+        set_results = [None] * len(possible_answer_sets)
+        for group_index, set_index in enumerate(group_set_indices):
+            best_narrowing_words = []
+            best_valid_word = None
+            for chunk_result in chunk_results:
+                chunk_best_narrowing_words, chunk_best_valid_word = chunk_result[group_index]
+                best_narrowing_words += chunk_best_narrowing_words
+                if best_valid_word is None or (chunk_best_valid_word is not None and chunk_best_valid_word[1] > best_valid_word[1]):
+                    best_valid_word = chunk_best_valid_word
+
+            best_narrowing_words.sort(key=lambda x: (x[1], x[2]), reverse=True)
+            set_results[set_index] = (best_narrowing_words[:k], best_valid_word)
+
+        return [set_results[history_set_indices[history_index]] for history_index in state_history_indices]
+
+    @staticmethod
+    def get_partition(word, possible_answers):
+        partition = {}
+        coloring_ids = WordleSolver._get_coloring_ids(word, possible_answers)
+        for coloring_id, answer in zip(coloring_ids, possible_answers):
+            if coloring_id not in partition:
+                partition[coloring_id] = []
+            partition[coloring_id].append(answer)
+        return partition
+
+    @staticmethod
+    def _get_k_best_guesses(word_list, grid, color_grid, word_index, chunk_size, pool, k, alphabet, score_function, is_higher_score_better):
         chunk = word_list[word_index:word_index+chunk_size]
         possible_answers = WordleSolver._get_possible_answers(word_list, grid, color_grid)
 
-        entropies = pool.starmap(
-            WordleSolver._get_shannon_entropy,
+        scores = pool.starmap(
+            score_function,
             [(word, possible_answers) for word in chunk]
         )
         
-        possible_answers_trie = Trie()
+        possible_answers_trie = Trie(alphabet)
         for answer in possible_answers:
             possible_answers_trie.insert(answer)
             
-        words_and_entropies = zip(chunk, entropies)
-        best_narrowing_words = [(word, entropy, possible_answers_trie.search(word)) for word, entropy in words_and_entropies]
-        best_narrowing_words.sort(key=lambda x: (x[1], x[2]), reverse=True)
+        scored_words = [(word, score, possible_answers_trie.search(word)) for word, score in zip(chunk, scores)]
+        return WordleSolver._rank_guesses(scored_words, k, is_higher_score_better)
+
+    @staticmethod
+    def _rank_guesses(scored_words, k, is_higher_score_better):
+        if is_higher_score_better:
+            scored_words.sort(key=lambda x: (x[1], x[2]), reverse=True)
+        else:
+            scored_words.sort(key=lambda x: (-x[1], x[2]), reverse=True)
 
         best_valid_word = None
-        for guess, entropy, is_valid_word in best_narrowing_words:
+        for guess, score, is_valid_word in scored_words:
             if is_valid_word:
-                best_valid_word = (guess, entropy, is_valid_word)
+                best_valid_word = (guess, score, is_valid_word)
                 break
 
-        best_narrowing_words = best_narrowing_words[:k]
+        return scored_words[:k], best_valid_word
+
+    @staticmethod
+    def _group_overlapping_sets(possible_answer_sets):
+        parents = list(range(len(possible_answer_sets)))
+
+        def find(set_index):
+            while parents[set_index] != set_index:
+                parents[set_index] = parents[parents[set_index]]
+                set_index = parents[set_index]
+            return set_index
+
+        answer_owners = {}
+        for set_index, possible_answers in enumerate(possible_answer_sets):
+            for answer in possible_answers:
+                if answer in answer_owners:
+                    parents[find(set_index)] = find(answer_owners[answer])
+                else:
+                    answer_owners[answer] = set_index
+
+        groups = {}
+        for set_index in range(len(possible_answer_sets)):
+            groups.setdefault(find(set_index), []).append(set_index)
+        return list(groups.values())
 
-        return best_narrowing_words, best_valid_word
-    
     @staticmethod
     def _get_possible_answers(word_list, grid, color_grid):
+        guessed_rows = WordleSolver._get_guessed_rows(grid, color_grid)
+        return WordleSolver._filter_possible_answers(word_list, guessed_rows)
+
+    @staticmethod
+    def _get_guessed_rows(grid, color_grid):
+        guessed_rows = []
+        for row, color_row in zip(grid, color_grid):
+            if row[0] == " ":
+                break
+            guessed_rows.append(("".join(row), WordleSolver._get_coloring_id(color_row)))
+
+        return tuple(guessed_rows)
+
+    @staticmethod
+    def _filter_possible_answers(word_list, guessed_rows):
         possible_answers = []
 
         for word in word_list:
             is_possible_answer = True
-            for row, color_row in zip(grid, color_grid):
-                if row[0] == " ":
-                    break
-
-                grid_word = "".join(row)
-                coloring = WordleSolver._get_coloring(grid_word, word)
-
-                if coloring != color_row:
+            for grid_word, coloring_id in guessed_rows:
+                if WordleSolver._get_fast_coloring_id(grid_word, word) != coloring_id:
                     is_possible_answer = False
                     break
             
@@ -53,32 +175,6 @@ class WordleSolver:
 
         return possible_answers
     
-    @staticmethod
-    def _get_coloring(word, answer):
-        counts = [0] * 26
-        for char in answer:
-            counts[ord(char) - ord('A')] += 1
-
-        coloring = ["x"] * 5
-
-        for i in range(5):
-            if coloring[i] != "x":
-                continue
-
-            if word[i] == answer[i]:
-                coloring[i] = "g"
-                counts[ord(word[i]) - ord('A')] -= 1
-
-        for i in range(5):
-            if coloring[i] != "x":
-                continue
-
-            if counts[ord(word[i]) - ord('A')] > 0:
-                coloring[i] = "y"
-                counts[ord(word[i]) - ord('A')] -= 1
-                
-        return coloring
-    
     @staticmethod
     def _get_coloring_id(coloring):
         coloring_id = 0
@@ -96,20 +192,89 @@ class WordleSolver:
         
         return coloring_id
     
+    @staticmethod
+    def _get_fast_coloring_id(word, answer):
+        if len(word) > MAX_WORD_LENGTH:
+            raise ValueError(f"Word length must be at most {MAX_WORD_LENGTH}.")
+
+        if word == answer:
+            return 3 ** len(word) - 1
+
+        coloring_id = 0
+        unmatched_answer_chars = []
+        unmatched_guesses = []
+        for exponent, guess_char, answer_char in zip(COLORING_EXPONENTS, word, answer):
+            if guess_char == answer_char:
+                coloring_id += 2 * exponent
+            else:
+                unmatched_answer_chars.append(answer_char)
+                unmatched_guesses.append((exponent, guess_char))
+
+        for exponent, guess_char in unmatched_guesses:
+            if guess_char in unmatched_answer_chars:
+                coloring_id += exponent
+                unmatched_answer_chars.remove(guess_char)
+
+        return coloring_id
+
+    @staticmethod
+    def _get_coloring_id_typecode(word_length):
+        if word_length <= 5:
+            return "B"
+        if word_length <= MAX_WORD_LENGTH:
+            return "H"
+        raise ValueError(f"Word length must be at most {MAX_WORD_LENGTH}.")
+
+    @staticmethod
+    def _get_coloring_ids(word, possible_answers):
+        return array(
+            WordleSolver._get_coloring_id_typecode(len(word)),
+            [WordleSolver._get_fast_coloring_id(word, answer) for answer in possible_answers]
+        )
+
+    @staticmethod
+    def _get_coloring_counts(word, possible_answers):
+        return Counter(WordleSolver._get_coloring_ids(word, possible_answers))
+
+    @staticmethod
+    def _get_worst_bucket_size(word, possible_answers):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        return max(WordleSolver._get_coloring_counts(word, possible_answers).values())
+
     @staticmethod
     def _get_shannon_entropy(word, possible_answers):
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-        coloring_counts = [0] * (3 ** 5)
-        for answer in possible_answers:
-            coloring = WordleSolver._get_coloring(word, answer)
-            coloring_id = WordleSolver._get_coloring_id(coloring)
-            coloring_counts[coloring_id] += 1
-        
+        coloring_counts = WordleSolver._get_coloring_counts(word, possible_answers)
+        return WordleSolver._get_entropy_from_counts(coloring_counts, len(possible_answers))
+
+    @staticmethod
+    def _get_entropy_from_counts(coloring_counts, total_answers):
         entropy = 0
-        total_answers = len(possible_answers)
-        for count in coloring_counts:
+        for count in coloring_counts.values():
             p = count / total_answers
-            if p > 0:
-                entropy -= p * log2(p)
-        return entropy
\ No newline at end of file
+            entropy -= p * log2(p)
+        return entropy
+
+    @staticmethod
+    def _get_k_optimal_guesses_for_sets(words, candidate_groups, k):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        results = []
+        for candidates, possible_answer_indices in candidate_groups:
+            candidate_indices = {answer: index for index, answer in enumerate(candidates)}
+            possible_answer_index_sets = [set(indices) for indices in possible_answer_indices]
+            set_entropies = [[] for _ in possible_answer_indices]
+
+            for word in words:
+                coloring_ids = WordleSolver._get_coloring_ids(word, candidates)
+                word_candidate_index = candidate_indices.get(word)
+                for indices, index_set, entropies in zip(possible_answer_indices, possible_answer_index_sets, set_entropies):
+                    coloring_counts = Counter(map(coloring_ids.__getitem__, indices))
+                    entropy = WordleSolver._get_entropy_from_counts(coloring_counts, len(indices))
+                    entropies.append((word, entropy, word_candidate_index in index_set))
+
+            results += [WordleSolver._rank_guesses(entropies, k, True) for entropies in set_entropies]
+
+        return results
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .Wordle import Wordle
+from .Absurdle import Absurdle
 from .WordleSolver import WordleSolver
 from .colors import colorize
 
-__all__ = ["Wordle", "WordleSolver", "colors"]
\ No newline at end of file
+__all__ = ["Wordle", "Absurdle", "WordleSolver", "colors"]
\ No newline at end of file
@@ -0,0 +1,4 @@
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+WORD_LENGTH = 5
+MIN_WORD_LENGTH = 4
+MAX_WORD_LENGTH = 8